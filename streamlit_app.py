@@ -0,0 +1,76 @@
+"""Streamlit front-end for the Weaviate chatbot."""
+
+import os
+import tempfile
+
+import streamlit as st
+
+from chatbot import WeaviateChatbot
+
+st.set_page_config(page_title="Weaviate Chatbot", page_icon="💬")
+st.title("💬 Weaviate Chatbot")
+
+if "messages" not in st.session_state:
+    st.session_state.messages = []
+if "pending_docs" not in st.session_state:
+    st.session_state.pending_docs = []
+
+with st.sidebar:
+    st.header("Setup")
+    weaviate_url = st.text_input("Weaviate URL", value="http://localhost:8080")
+
+    if st.button("Initialize Chatbot"):
+        with st.spinner("Loading models and connecting to Weaviate..."):
+            st.session_state.chatbot = WeaviateChatbot(weaviate_url=weaviate_url)
+        st.success("Chatbot ready!")
+
+    if "chatbot" in st.session_state:
+        st.header("Knowledge Base")
+
+        uploaded_file = st.file_uploader("Upload a text file", type=["txt", "md"])
+        if uploaded_file is not None and st.button("Add File"):
+            with tempfile.NamedTemporaryFile(
+                mode="wb", suffix=".txt", delete=False
+            ) as tmp:
+                tmp.write(uploaded_file.getvalue())
+                tmp_path = tmp.name
+            try:
+                added = st.session_state.chatbot.add_text_file(tmp_path)
+                st.success(f"Added {added} document(s).")
+            finally:
+                os.unlink(tmp_path)
+
+        # Staged adds are committed in one add_documents call so the
+        # embedder sees a single batch and Weaviate one batched write,
+        # instead of one tiny insert per click.
+        manual_text = st.text_area("Or paste text directly")
+        if st.button("Add Text") and manual_text.strip():
+            st.session_state.pending_docs.append(manual_text)
+            st.info(f"Staged ({len(st.session_state.pending_docs)} pending).")
+
+        pending = len(st.session_state.pending_docs)
+        if pending and st.button(f"Commit {pending} doc(s)"):
+            st.session_state.chatbot.add_documents(st.session_state.pending_docs)
+            st.session_state.pending_docs = []
+            st.success(f"Added {pending} document(s).")
+
+        if st.button("Clear Knowledge Base"):
+            chatbot = st.session_state.chatbot
+            chatbot.clear_knowledge_base(session_id=chatbot.session_id)
+            st.session_state.messages = []
+            st.success("Knowledge base cleared.")
+
+for message in st.session_state.messages:
+    with st.chat_message(message["role"]):
+        st.markdown(message["content"])
+
+if prompt := st.chat_input("Ask a question about your documents"):
+    if "chatbot" not in st.session_state:
+        st.warning("Initialize the chatbot from the sidebar first.")
+    else:
+        st.session_state.messages.append({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        with st.chat_message("assistant"):
+            answer = st.write_stream(st.session_state.chatbot.stream_chat(prompt))
+        st.session_state.messages.append({"role": "assistant", "content": answer})
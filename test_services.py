@@ -0,0 +1,83 @@
+"""Connectivity checks for the local services the chatbot depends on.
+
+Run directly (``python test_services.py``) to verify that the vLLM embedding
+server and Weaviate are reachable before starting the Streamlit app. All
+requests go through a shared pooled session so repeated calls reuse TCP
+connections instead of paying a handshake each time.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+VLLM_URL = "http://localhost:8000"
+WEAVIATE_URL = "http://localhost:8080"
+
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+
+def test_vllm_embeddings() -> bool:
+    """Check that the vLLM /v1/embeddings endpoint answers."""
+    try:
+        response = _SESSION.post(
+            f"{VLLM_URL}/v1/embeddings",
+            json={"model": "bge-small-en-v1.5", "input": "hello world"},
+            headers={"Content-Type": "application/json"},
+            timeout=30,
+        )
+        response.raise_for_status()
+        print("vLLM embeddings: OK")
+        return True
+    except requests.RequestException as exc:
+        print(f"vLLM embeddings: FAILED ({exc})")
+        return False
+
+
+def test_weaviate() -> bool:
+    """Check that Weaviate reports ready."""
+    try:
+        response = _SESSION.get(
+            f"{WEAVIATE_URL}/v1/.well-known/ready", timeout=30
+        )
+        response.raise_for_status()
+        print("Weaviate: OK")
+        return True
+    except requests.RequestException as exc:
+        print(f"Weaviate: FAILED ({exc})")
+        return False
+
+
+def benchmark_vllm_embeddings(n_requests: int = 32, workers: int = 8) -> None:
+    """Fire concurrent embedding requests to exercise server-side batching.
+
+    The pooled session keeps one warm connection per worker, so the numbers
+    reflect server throughput rather than TCP setup overhead.
+    """
+
+    def one(i: int) -> bool:
+        response = _SESSION.post(
+            f"{VLLM_URL}/v1/embeddings",
+            json={"model": "bge-small-en-v1.5", "input": f"benchmark text {i}"},
+            timeout=30,
+        )
+        return response.ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(one, range(n_requests)))
+    elapsed = time.perf_counter() - start
+    ok = sum(results)
+    print(
+        f"embeddings benchmark: {ok}/{n_requests} ok in {elapsed:.2f}s "
+        f"({n_requests / elapsed:.1f} req/s, {workers} workers)"
+    )
+
+
+if __name__ == "__main__":
+    ok = test_vllm_embeddings() & test_weaviate()
+    if ok:
+        benchmark_vllm_embeddings()
+    raise SystemExit(0 if ok else 1)